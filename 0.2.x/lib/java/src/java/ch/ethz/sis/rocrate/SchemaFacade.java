@@ -46,6 +46,10 @@ public class SchemaFacade implements ISchemaFacade
 
     public static final String RDFS_COMMENT = "rdfs:comment";
 
+    private static final ObjectMapper OBJECT_MAPPER = new ObjectMapper();
+
+    private static final Pattern PLACEHOLDER_PATTERN = Pattern.compile("^_:");
+
 
 
     Pattern p;
@@ -196,7 +200,6 @@ public class SchemaFacade implements ISchemaFacade
         {
             builder.addType(type);
         }
-        ObjectMapper objectMapper = new ObjectMapper();
 
         metaDataEntry.getValues().forEach((s, o) -> {
             if (o instanceof Double)
@@ -213,7 +216,7 @@ public class SchemaFacade implements ISchemaFacade
                 builder.addProperty(s, o.toString());
             } else if (o == null)
             {
-                builder.addProperty(s, objectMapper.nullNode());
+                builder.addProperty(s, OBJECT_MAPPER.nullNode());
             }
         });
         DataEntity dataEntity = builder.build();
@@ -245,7 +248,7 @@ public class SchemaFacade implements ISchemaFacade
 
     private boolean matchClasses(String queryClassId, IMetadataEntry entry)
     {
-        if (entry.getTypes().stream().anyMatch(x -> x.equals(queryClassId)))
+        if (entry.getTypes().contains(queryClassId))
         {
             return true;
         }
@@ -260,8 +263,9 @@ public class SchemaFacade implements ISchemaFacade
     private void parseEntities() throws JsonProcessingException
     {
 
-        localPrefix = getLocalPrefix(crate.getJsonMetadata());
         Map<String, String> keyValuePairs = getKeyValPairsFromMetadata(crate.getJsonMetadata());
+        localPrefix = getLocalPrefix(keyValuePairs);
+        p = Pattern.compile("^" + localPrefix + ":", Pattern.CASE_INSENSITIVE);
         for (var keyValPair : keyValuePairs.entrySet())
         {
             if (keyValPair.getValue().equals("http://schema.org/rangeIncludes"))
@@ -283,105 +287,84 @@ public class SchemaFacade implements ISchemaFacade
 
         Map<String, Type> restrictionToTypeId = new LinkedHashMap<>();
 
-
-
+        Map<String, List<DataEntity>> entitiesByType = new HashMap<>();
         for (DataEntity entity : crate.getAllDataEntities())
         {
-            String type = entity
-                    .getProperty("@type").asText();
+            entitiesByType.computeIfAbsent(entity.getProperty("@type").asText(),
+                    x -> new ArrayList<>()).add(entity);
+        }
+
+        for (DataEntity entity : entitiesByType.getOrDefault(RDFS_CLASS, List.of()))
+        {
             String id =
                     entity.getProperty("@id")
                             .asText();
 
-            switch (type)
-            {
-                case "rdfs:Class" ->
-                {
-                    Type myType = new Type();
-                    myType.setSubClassOf(parseMultiValued(entity, "rdfs:subClassOf"));
-                    myType.setOntologicalAnnotations(
-                            parseMultiValued(entity, EQUIVALENT_CLASS));
-                    myType.setId(resolvePrefixSingleValue(id));
-                    classes.put(resolvePrefixSingleValue(id), myType);
-                    parseMultiValued(entity, OWL_RESTRICTION).forEach(
-                            x -> restrictionToTypeId.put(x, myType));
-
-                }
-
-
-            }
-
+            Type myType = new Type();
+            myType.setSubClassOf(parseMultiValued(entity, "rdfs:subClassOf"));
+            myType.setOntologicalAnnotations(
+                    parseMultiValued(entity, EQUIVALENT_CLASS));
+            myType.setId(resolvePrefixSingleValue(id));
+            classes.put(resolvePrefixSingleValue(id), myType);
+            parseMultiValued(entity, OWL_RESTRICTION).forEach(
+                    x -> restrictionToTypeId.put(x, myType));
         }
 
-        for (DataEntity entity : crate.getAllDataEntities())
+        for (DataEntity entity : entitiesByType.getOrDefault(RDFS_PROPERTY, List.of()))
         {
-            String type = entity
-                    .getProperty("@type").asText();
             String id =
                     entity.getProperty("@id")
                             .asText();
 
-            switch (type)
-            {
-                case "rdfs:Property" ->
-                {
-                    PropertyType rdfsProperty = new PropertyType();
-                    rdfsProperty.setId(resolvePrefixSingleValue(id));
-
-                    rdfsProperty.setOntologicalAnnotations(
-                            parseMultiValued(entity, EQUIVALENT_CONCEPT));
-
-                    List<String> rawRange = parseMultiValued(entity, rangeIdentifier);
-
-                    List<IDataType> dataTypes = rawRange.stream()
-                            .filter(LiteralType::isLiteralType)
-                            .map(LiteralType::getByTypeName)
-                            .filter(Objects::nonNull)
-                            .collect(Collectors.toList());
-                    List<IType> types = rawRange.stream()
-                            .filter(x -> !LiteralType.isLiteralType(x))
-                            .map(this::resolvePrefixSingleValue)
-                            .map(classes::get)
-                            .collect(Collectors.toList());
-
-                    dataTypes.stream().forEach(rdfsProperty::addDataType);
-                    types.forEach(rdfsProperty::addType);
-
-                    rdfsProperty.setDomainIncludes(
-                            parseMultiValued(entity, domainIdentifier).stream()
-                                    .map(x -> resolvePrefixSingleValue(x))
-                                    .map(classes::get).collect(
-                                            Collectors.toList()));
-                    properties.put(resolvePrefixSingleValue(id), rdfsProperty);
-
-                }
-            }
-
+            PropertyType rdfsProperty = new PropertyType();
+            rdfsProperty.setId(resolvePrefixSingleValue(id));
+
+            rdfsProperty.setOntologicalAnnotations(
+                    parseMultiValued(entity, EQUIVALENT_CONCEPT));
+
+            List<String> rawRange = parseMultiValued(entity, rangeIdentifier);
+
+            List<IDataType> dataTypes = rawRange.stream()
+                    .filter(LiteralType::isLiteralType)
+                    .map(LiteralType::getByTypeName)
+                    .filter(Objects::nonNull)
+                    .collect(Collectors.toList());
+            List<IType> types = rawRange.stream()
+                    .filter(x -> !LiteralType.isLiteralType(x))
+                    .map(this::resolvePrefixSingleValue)
+                    .map(classes::get)
+                    .collect(Collectors.toList());
+
+            dataTypes.stream().forEach(rdfsProperty::addDataType);
+            types.forEach(rdfsProperty::addType);
+
+            rdfsProperty.setDomainIncludes(
+                    parseMultiValued(entity, domainIdentifier).stream()
+                            .map(x -> resolvePrefixSingleValue(x))
+                            .map(classes::get).collect(
+                                    Collectors.toList()));
+            properties.put(resolvePrefixSingleValue(id), rdfsProperty);
         }
 
-        for (DataEntity entity : crate.getAllDataEntities())
+        for (DataEntity entity : entitiesByType.getOrDefault(OWL_RESTRICTION, List.of()))
         {
-            String type = entity.getProperty("@type").asText();
             String id =
                     entity.getProperty("@id")
                             .asText();
 
-            if (type.equals(OWL_RESTRICTION))
-            {
-                String onProperty = parseMultiValued(entity, ON_PROPERTY).get(0);
-                int minCardinality =
-                        entity.getProperty(OWL_MIN_CARDINALITY).numberValue().intValue();
-
-                int maxCardinality =
-                        entity.getProperty(OWL_MAX_CARDINALITY).numberValue().intValue();
-                Restriction restriction =
-                        new Restriction(id, properties.get(onProperty), minCardinality,
-                                maxCardinality);
-                restrictionToTypeId.get(id).addRestriction(restriction);
-            }
+            String onProperty = parseMultiValued(entity, ON_PROPERTY).get(0);
+            int minCardinality =
+                    entity.getProperty(OWL_MIN_CARDINALITY).numberValue().intValue();
 
+            int maxCardinality =
+                    entity.getProperty(OWL_MAX_CARDINALITY).numberValue().intValue();
+            Restriction restriction =
+                    new Restriction(id, properties.get(onProperty), minCardinality,
+                            maxCardinality);
+            restrictionToTypeId.get(id).addRestriction(restriction);
         }
 
+        Map<String, Boolean> isLiteralProperty = new HashMap<>();
 
         for (var entity : crate.getAllDataEntities())
         {
@@ -390,7 +373,7 @@ public class SchemaFacade implements ISchemaFacade
             String id =
                     entity.getProperty("@id")
                             .asText();
-            if (!doesTypeExist(type, classes, localPrefix))
+            if (!doesTypeExist(type, classes))
             {
                 continue;
             }
@@ -401,15 +384,16 @@ public class SchemaFacade implements ISchemaFacade
 
             entry.setTypes(resolvePrefix(type));
             Map<String, List<String>> references = new LinkedHashMap<>();
-            ObjectMapper objectMapper = new ObjectMapper();
             Map<String, Serializable> keyVals =
-                    objectMapper.readValue(entity.getProperties().toString(), HashMap.class);
+                    OBJECT_MAPPER.readValue(entity.getProperties().toString(), HashMap.class);
             for (Map.Entry<String, Serializable> a : keyVals.entrySet())
             {
                 if (properties.containsKey(a.getKey()))
                 {
-                    IPropertyType property = properties.get(a.getKey());
-                    if (property.getRange().stream().anyMatch(x -> x.startsWith("xsd:")))
+                    boolean isLiteral = isLiteralProperty.computeIfAbsent(a.getKey(),
+                            x -> properties.get(x).getRange().stream()
+                                    .anyMatch(range -> range.startsWith("xsd:")));
+                    if (isLiteral)
                     {
                         entryProperties.put(a.getKey(), a.getValue().toString());
                     } else
@@ -423,7 +407,6 @@ public class SchemaFacade implements ISchemaFacade
             entry.setReferences(references);
             entries.put(id, entry);
         }
-        System.out.println("Done");
         this.types = classes;
         this.propertyTypes = properties;
         this.metadataEntries = entries;
@@ -432,12 +415,10 @@ public class SchemaFacade implements ISchemaFacade
 
     private Set<String> resolvePrefix(Set<String> types)
     {
-        Pattern placeholderPattern = Pattern.compile("^_:");
-
         LinkedHashSet newTypes = new LinkedHashSet();
         for (String type : types)
         {
-            newTypes.add(placeholderPattern.matcher(type).replaceAll(localPrefix));
+            newTypes.add(PLACEHOLDER_PATTERN.matcher(type).replaceAll(localPrefix));
 
         }
         return newTypes;
@@ -445,9 +426,7 @@ public class SchemaFacade implements ISchemaFacade
 
     private String resolvePrefixSingleValue(String type)
     {
-        Pattern placeholderPattern = Pattern.compile("^_:");
-
-        return placeholderPattern.matcher(type).replaceAll(localPrefix);
+        return PLACEHOLDER_PATTERN.matcher(type).replaceAll(localPrefix);
     }
 
     private List<String> parseMultiValued(DataEntity dataEntity, String key)
@@ -491,8 +470,7 @@ public class SchemaFacade implements ISchemaFacade
     Map<String, String> getKeyValPairsFromMetadata(String metaDataJson)
             throws JsonProcessingException
     {
-        ObjectMapper objectMapper = new ObjectMapper();
-        LinkedHashMap vals = objectMapper.readValue(metaDataJson, LinkedHashMap.class);
+        LinkedHashMap vals = OBJECT_MAPPER.readValue(metaDataJson, LinkedHashMap.class);
 
         if (vals.get("@context") instanceof LinkedHashMap<?, ?>)
         {
@@ -521,7 +499,11 @@ public class SchemaFacade implements ISchemaFacade
 
     String getLocalPrefix(String jsonMetaData) throws JsonProcessingException
     {
-        Map<String, String> keyVals = getKeyValPairsFromMetadata(jsonMetaData);
+        return getLocalPrefix(getKeyValPairsFromMetadata(jsonMetaData));
+    }
+
+    private String getLocalPrefix(Map<String, String> keyVals)
+    {
         for (Map.Entry<String, String> entry : keyVals.entrySet())
         {
             if (entry.getValue().equals("_:"))
@@ -533,10 +515,8 @@ public class SchemaFacade implements ISchemaFacade
         return "";
     }
 
-    boolean doesTypeExist(Set<String> types, Map<String, IType> classes, String localPrefix)
+    boolean doesTypeExist(Set<String> types, Map<String, IType> classes)
     {
-        p = Pattern.compile("^" + localPrefix + ":", Pattern.CASE_INSENSITIVE);
-
         boolean somethingFound = false;
         for (String type : types)
         {
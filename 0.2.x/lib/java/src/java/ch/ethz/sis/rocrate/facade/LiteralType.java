@@ -1,5 +1,8 @@
 package ch.eth.sis.rocrate.facade;
 
+import java.util.HashMap;
+import java.util.Map;
+
 /**
  * List of primitives as supported by xsd
  * https://www.ibm.com/docs/en/jfsm/1.1.2.1?topic=queries-xsd-data-types
@@ -17,6 +20,16 @@ public enum LiteralType implements IDataType
     STRING("xsd:string"),
     XML_LITERAL("rdf:XMLLiteral");
 
+    private static final Map<String, LiteralType> BY_TYPE_NAME = new HashMap<>();
+
+    static
+    {
+        for (LiteralType literalType : LiteralType.values())
+        {
+            BY_TYPE_NAME.put(literalType.getTypeName(), literalType);
+        }
+    }
+
     final String typeName;
 
     LiteralType(String typeName)
@@ -32,26 +45,17 @@ public enum LiteralType implements IDataType
 
     public static boolean isLiteralType(String typeName)
     {
-        for (LiteralType literalType : LiteralType.values())
-        {
-            if (typeName.equals(literalType.getTypeName()))
-            {
-                return true;
-            }
-        }
-        return false;
+        return BY_TYPE_NAME.containsKey(typeName);
     }
 
     public static LiteralType getByTypeName(String typeName)
     {
-        for (LiteralType literalType : LiteralType.values())
+        LiteralType literalType = BY_TYPE_NAME.get(typeName);
+        if (literalType == null)
         {
-            if (typeName.equals(literalType.getTypeName()))
-            {
-                return literalType;
-            }
+            throw new IllegalArgumentException("Unknown literal type: " + typeName);
         }
-        throw new IllegalArgumentException("Unknown literal type: " + typeName);
+        return literalType;
 
     }
 
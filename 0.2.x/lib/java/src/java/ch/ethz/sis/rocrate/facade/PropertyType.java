@@ -24,6 +24,7 @@ public class PropertyType implements IPropertyType
 
     public PropertyType()
     {
+        this.domainIncludes = new ArrayList<>();
         this.rangeIncludes = new ArrayList<>();
         this.rangeeIndlucesDataType = new ArrayList<>();
         this.ontologicalAnnotations = new ArrayList<>();